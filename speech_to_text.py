@@ -8,37 +8,147 @@ import os
 import sys
 import argparse
 import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src directory to path to use local codebase
 sys.path.insert(0, 'src')
 
+# Warmed-up StreamingASR instances shared across SpeechToText objects,
+# keyed by (chunk_size, debug, precision)
+_ASR_CACHE = {}
+
+# Maximum refresh rate for partial results in live mode
+PARTIAL_HZ = 10
+
+# Shared stand-in for results that carry no chunk_info; never mutated
+_EMPTY = {}
+
+def _unpack(results):
+    """Turn StreamingASR result dicts into (final, partial, text, chunk_info) tuples."""
+    for r in results:
+        yield r.get('final'), r.get('partial'), r.get('text'), r.get('chunk_info') or _EMPTY
+
+def _dumps(obj):
+    """Serialize to UTF-8 encoded JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+class _ResultWriter:
+    """Incrementally write results to a JSON file as segments arrive."""
+    
+    def __init__(self, output_file, metadata):
+        self.file = open(output_file, 'wb')
+        self.count = 0
+        try:
+            self.file.write(b'{\n  "metadata": ')
+            self.file.write(_dumps(metadata))
+            self.file.write(b',\n  "segments": [')
+        except Exception:
+            self.file.close()
+            raise
+    
+    def write_segment(self, text):
+        """Append one final segment to the segments array."""
+        self.file.write(b',\n    ' if self.count else b'\n    ')
+        self.file.write(_dumps(text))
+        self.count += 1
+    
+    def close(self, transcription):
+        """Write the complete transcription and close the JSON document."""
+        if self.file.closed:
+            return
+        try:
+            self.file.write(b'\n  ],\n  "transcription": ')
+            self.file.write(_dumps(transcription))
+            self.file.write(b'\n}\n')
+        finally:
+            # Release the handle even if the disk is full or the write failed
+            self.file.close()
+
 class SpeechToText:
     """Main class for speech-to-text functionality."""
     
-    def __init__(self, chunk_size=640, debug=False):
-        """Initialize the speech-to-text engine."""
+    def __init__(self, chunk_size=640, debug=False, precision=None, preload=True):
+        """Initialize the speech-to-text engine.
+        
+        With preload=False the ASR modules are imported on the first
+        initialize() call instead of in a background thread.
+        """
         self.chunk_size = chunk_size
         self.debug = debug
+        self.precision = precision or os.environ.get('VISTREAM_DTYPE', 'fp32')
         self.asr = None
         
+        # Import torch and the ASR modules in the background so the cost
+        # overlaps with the interactive menu and the sounddevice checks
+        self._streaming = None
+        self._import_error = None
+        self._import_thread = None
+        if preload:
+            self._import_thread = threading.Thread(target=self._preimport, daemon=True)
+            self._import_thread.start()
+    
+    def _preimport(self):
+        """Import the streaming module (and with it torch) off the main thread."""
+        try:
+            import streaming
+            self._streaming = streaming
+        except Exception as e:
+            self._import_error = e
+        
     def initialize(self):
         """Initialize the ASR engine."""
-        try:
-            from streaming import StreamingASR
-            self.asr = StreamingASR(chunk_size_ms=self.chunk_size, debug=self.debug)
-            if self.debug:
-                print("✅ ASR engine initialized successfully")
-            return True
-        except ImportError as e:
-            print(f"❌ Failed to import StreamingASR: {e}")
+        if self._import_thread is not None:
+            self._import_thread.join()
+        elif self._streaming is None:
+            self._preimport()
+        if self._streaming is None:
+            print(f"❌ Failed to import StreamingASR: {self._import_error}")
             return False
+        StreamingASR = self._streaming.StreamingASR
+        
+        key = (self.chunk_size, self.debug, self.precision)
+        asr = _ASR_CACHE.get(key)
+        if asr is None:
+            try:
+                asr = StreamingASR(chunk_size_ms=self.chunk_size, debug=self.debug, precision=self.precision)
+                asr.warmup()
+            except Exception as e:
+                print(f"❌ Failed to initialize ASR engine: {e}")
+                return False
+            _ASR_CACHE[key] = asr
+        
+        self.asr = asr
+        if self.debug:
+            print("✅ ASR engine initialized successfully")
+        return True
+    
+    def _emit_segment(self, writer, chunk_info, final_text):
+        """Print a final segment and append it to the results file."""
+        print(f"✅ Segment {chunk_info.get('chunk_id', '?'):3d}: {final_text}")
+        if writer:
+            writer.write_segment(final_text)
     
     def transcribe_file(self, audio_file, output_file=None):
         """Transcribe audio from file."""
-        if not os.path.exists(audio_file):
+        # Opening the file checks both that it exists and that it is readable
+        try:
+            open(audio_file, 'rb').close()
+        except FileNotFoundError:
             print(f"❌ Audio file not found: {audio_file}")
             return None
+        except OSError as e:
+            print(f"❌ Cannot open audio file {audio_file}: {e}")
+            return None
         
         if not self.asr and not self.initialize():
             return None
@@ -56,17 +166,37 @@ class SpeechToText:
             }
         }
         
+        # Sized from the chunk count on the first final result; there is at
+        # most one final segment per chunk, so the list never has to grow
         final_segments = []
+        count = 0
+        writer = None
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = []
         
         try:
-            for result in self.asr.stream_from_file(audio_file):
-                if result.get('final'):
-                    final_text = result['text']
-                    final_segments.append(final_text)
-                    chunk_info = result.get('chunk_info', {})
-                    print(f"✅ Segment {chunk_info.get('chunk_id', '?'):3d}: {final_text}")
+            if output_file:
+                writer = _ResultWriter(output_file, results['metadata'])
+            for final, _, final_text, chunk_info in _unpack(self.asr.stream_from_file(audio_file)):
+                if final:
+                    if not final_segments:
+                        final_segments = [None] * chunk_info.get('total_chunks', 0)
+                    if count < len(final_segments):
+                        final_segments[count] = final_text
+                    else:
+                        final_segments.append(final_text)
+                    count += 1
+                    # Output is handled off-thread so the ASR generator never
+                    # waits on terminal or disk I/O. With debug=True the
+                    # StreamingASR debug prints can interleave with these lines.
+                    pending.append(executor.submit(self._emit_segment, writer, chunk_info, final_text))
+            
+            # Wait for all segments to be printed and written
+            for future in pending:
+                future.result()
             
             # Combine all segments
+            del final_segments[count:]
             complete_text = " ".join(final_segments)
             results['transcription'] = complete_text
             results['segments'] = final_segments
@@ -75,23 +205,31 @@ class SpeechToText:
             print("-" * 40)
             print(complete_text)
             
-            # Save results if output file specified
-            if output_file:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+            # Finish the results file if output file specified
+            if writer:
+                writer.close(complete_text)
+                writer = None
                 print(f"💾 Results saved to: {output_file}")
             
             return results
             
         except Exception as e:
+            # Let already submitted segments finish printing before the error
+            executor.shutdown(wait=True)
             print(f"❌ Error during transcription: {e}")
             return None
+        finally:
+            executor.shutdown(wait=True)
+            # Keep the results file valid JSON if transcription was cut short;
+            # best effort, since the file itself may be what failed
+            if writer:
+                try:
+                    writer.close(" ".join(final_segments[:count]))
+                except OSError:
+                    pass
     
     def transcribe_microphone(self, duration=10, output_file=None):
         """Transcribe audio from microphone."""
-        if not self.asr and not self.initialize():
-            return None
-        
         try:
             import sounddevice as sd
         except ImportError:
@@ -108,6 +246,10 @@ class SpeechToText:
             print(f"❌ Error checking audio devices: {e}")
             return None
         
+        # Joins the background import, so only done once the devices check out
+        if not self.asr and not self.initialize():
+            return None
+        
         print(f"🎤 Recording for {duration} seconds...")
         print("🔊 Please speak into your microphone...")
         print("=" * 50)
@@ -123,17 +265,25 @@ class SpeechToText:
             }
         }
         
-        final_segments = []
+        # At most one final segment per chunk, so size the list up front
+        final_segments = [None] * (int(duration * 1000 / self.chunk_size) + 1)
+        count = 0
+        writer = None
         
         try:
-            for result in self.asr.stream_from_microphone(duration_seconds=duration):
-                if result.get('final'):
-                    final_text = result['text']
-                    final_segments.append(final_text)
-                    chunk_info = result.get('chunk_info', {})
-                    print(f"✅ Segment {chunk_info.get('chunk_id', '?'):3d}: {final_text}")
+            if output_file:
+                writer = _ResultWriter(output_file, results['metadata'])
+            for final, _, final_text, chunk_info in _unpack(self.asr.stream_from_microphone(duration_seconds=duration)):
+                if final:
+                    if count < len(final_segments):
+                        final_segments[count] = final_text
+                    else:
+                        final_segments.append(final_text)
+                    count += 1
+                    self._emit_segment(writer, chunk_info, final_text)
             
             # Combine all segments
+            del final_segments[count:]
             complete_text = " ".join(final_segments)
             results['transcription'] = complete_text
             results['segments'] = final_segments
@@ -142,10 +292,10 @@ class SpeechToText:
             print("-" * 40)
             print(complete_text)
             
-            # Save results if output file specified
-            if output_file:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+            # Finish the results file if output file specified
+            if writer:
+                writer.close(complete_text)
+                writer = None
                 print(f"💾 Results saved to: {output_file}")
             
             return results
@@ -156,32 +306,47 @@ class SpeechToText:
         except Exception as e:
             print(f"❌ Error during microphone recording: {e}")
             return None
+        finally:
+            # Keep the results file valid JSON if transcription was cut short;
+            # best effort, since the file itself may be what failed
+            if writer:
+                try:
+                    writer.close(" ".join(final_segments[:count]))
+                except OSError:
+                    pass
     
     def transcribe_live(self):
         """Continuous live transcription until interrupted."""
-        if not self.asr and not self.initialize():
-            return None
-        
         try:
             import sounddevice as sd
         except ImportError:
             print("❌ sounddevice library not installed. Install with: pip install sounddevice")
             return None
         
+        if not self.asr and not self.initialize():
+            return None
+        
         print("🎤 Starting live transcription...")
         print("🔊 Speak freely. Press Ctrl+C to stop.")
         print("=" * 50)
         
         final_segments = []
+        last_partial = 0.0
         
         try:
-            for result in self.asr.stream_from_microphone(duration_seconds=None):
-                if result.get('partial'):
-                    text = result['text'][:60] + "..." if len(result['text']) > 60 else result['text']
-                    print(f"🎙️  [PARTIAL] {text}", end='\r')
+            for final, partial, text, _ in _unpack(self.asr.stream_from_microphone(duration_seconds=None)):
+                if partial:
+                    # Partials are superseded quickly, so skip redraws that
+                    # would exceed PARTIAL_HZ; finals are always printed
+                    now = time.monotonic()
+                    if now - last_partial >= 1 / PARTIAL_HZ:
+                        last_partial = now
+                        shown = text[:60] + "..." if len(text) > 60 else text
+                        sys.stdout.write(f"🎙️  [PARTIAL] {shown}\r")
+                        sys.stdout.flush()
                 
-                if result.get('final'):
-                    final_text = result['text']
+                if final:
+                    final_text = text
                     final_segments.append(final_text)
                     print(f"\n✅ [FINAL] {final_text}")
             
@@ -216,6 +381,9 @@ Usage Examples:
   python speech_to_text.py --live                                # Continuous live transcription
   python speech_to_text.py --file audio.wav --output results.json # Save results
   python speech_to_text.py --file audio.wav --chunk-size 320     # Smaller chunks
+  python speech_to_text.py --file audio.wav --precision fp16     # Half precision (CUDA)
+
+The precision can also be set with the VISTREAM_DTYPE environment variable.
         """
     )
     
@@ -225,12 +393,16 @@ Usage Examples:
     parser.add_argument('--duration', type=int, default=10, help='Recording duration in seconds (default: 10)')
     parser.add_argument('--chunk-size', type=int, default=640, help='Chunk size in milliseconds (default: 640)')
     parser.add_argument('--output', type=str, help='Output file for results (JSON format)')
+    parser.add_argument('--precision', choices=['fp32', 'fp16'],
+                        help='Inference precision (default: $VISTREAM_DTYPE or fp32)')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
     
-    # Create speech-to-text instance
-    stt = SpeechToText(chunk_size=args.chunk_size, debug=args.debug)
+    # Create speech-to-text instance. File mode has nothing to overlap the
+    # import with, and a missing file should not start importing torch.
+    stt = SpeechToText(chunk_size=args.chunk_size, debug=args.debug, precision=args.precision,
+                       preload=not args.file)
     
     # Determine mode
     if args.file:
@@ -258,10 +430,7 @@ Usage Examples:
         
         if choice == "1":
             file_path = input("Enter audio file path: ").strip()
-            if os.path.exists(file_path):
-                stt.transcribe_file(file_path)
-            else:
-                print("❌ File not found")
+            stt.transcribe_file(file_path)
                 
         elif choice == "2":
             duration = int(input("Enter recording duration (seconds): ").strip() or "10")
@@ -20,6 +20,7 @@ from torchaudio.models.decoder import ctc_decoder
 from torch.nn.utils.rnn import pad_sequence
 import numpy as np
 import time
+import contextlib
 import tarfile
 import tempfile
 import requests
@@ -60,6 +61,10 @@ symbols = {
 use_gpu = torch.cuda.is_available()
 device = 'cuda' if use_gpu else 'cpu'
 
+# Supported inference precisions. int8 is not offered: the acoustic model is a
+# TorchScript module, which eager-mode dynamic quantization leaves unchanged.
+PRECISIONS = ('fp32', 'fp16')
+
 def get_cache_dir():
     """Get the ViStreamASR cache directory."""
     cache_dir = Path.home() / ".cache" / "ViStreamASR"
@@ -276,7 +281,7 @@ def load_models(debug_mode=False):
 
 def ngram_beam_search(ngram_beam_search_decoder, emission):
     """Perform n-gram beam search decoding."""
-    ngram_beam_search_result = ngram_beam_search_decoder(emission.cpu())
+    ngram_beam_search_result = ngram_beam_search_decoder(emission.float().cpu())
     decoder_output_tokens = []
     decoder_output_transcript = []
     decoder_ngram_best_transcipts = []
@@ -432,7 +437,10 @@ class IncrementalASR():
 class ASREngine:
     """Main ASR Engine class that handles all streaming functionality."""
     
-    def __init__(self, chunk_size_ms=640, max_duration_before_forced_finalization=15.0, debug_mode=False):
+    def __init__(self, chunk_size_ms=640, max_duration_before_forced_finalization=15.0, debug_mode=False, precision='fp32'):
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unsupported precision '{precision}', expected one of {PRECISIONS}")
+        
         # Model components
         self.acoustic_model = None
         self.ngram_lm = None
@@ -449,6 +457,7 @@ class ASREngine:
         self.chunk_size_ms = chunk_size_ms
         self.max_duration_before_forced_finalization = max_duration_before_forced_finalization
         self.debug_mode = debug_mode
+        self.precision = precision
         
         # Calculate max_chunks_before_forced_finalization dynamically
         self.max_chunks_before_forced_finalization = int(
@@ -459,6 +468,7 @@ class ASREngine:
             print(f"{symbols['tool']} [CONFIG] Chunk size: {self.chunk_size_ms}ms")
             print(f"{symbols['tool']} [CONFIG] Max duration before forced finalization: {self.max_duration_before_forced_finalization}s")
             print(f"{symbols['tool']} [CONFIG] Max chunks before forced finalization: {self.max_chunks_before_forced_finalization}")
+            print(f"{symbols['tool']} [CONFIG] Precision: {self.precision}")
         
         # Timing tracking for pure ASR performance
         self.asr_processing_time = 0.0
@@ -468,8 +478,24 @@ class ASREngine:
         """Initialize all models if not already loaded."""
         if self.acoustic_model is None:
             self.acoustic_model, self.ngram_lm, self.beam_search = load_models(debug_mode=self.debug_mode)
+            self._apply_precision()
             self.asr_realtime_model = IncrementalASR(self.acoustic_model, device=device)
     
+    def _apply_precision(self):
+        """Adapt the acoustic model to the requested precision."""
+        if self.precision == 'fp16' and not use_gpu:
+            print(f"{symbols['warning']}  [ENGINE] fp16 requires a CUDA device, using fp32")
+            self.precision = 'fp32'
+        
+        if self.debug_mode:
+            print(f"{symbols['check']} [ENGINE] Running inference in {self.precision}")
+    
+    def _precision_context(self):
+        """Context manager that runs model calls at the requested precision."""
+        if self.precision == 'fp16':
+            return torch.autocast(device_type='cuda', dtype=torch.float16)
+        return contextlib.nullcontext()
+    
     def reset_state(self):
         """Reset ASR state and transcription."""
         if self.debug_mode:
@@ -751,4 +777,5 @@ class ASREngine:
                 'new_final_text': None
             }
         
-        return self.process_audio_chunk(audio_data, 16000, is_last) 
\ No newline at end of file
+        with self._precision_context():
+            return self.process_audio_chunk(audio_data, 16000, is_last) 
\ No newline at end of file
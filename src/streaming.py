@@ -7,6 +7,7 @@ the low-level ASREngine for easy-to-use streaming ASR functionality.
 
 import os
 import time
+import queue
 import torch
 import torchaudio
 from typing import Generator, Dict, Any, Optional
@@ -14,6 +15,7 @@ from pathlib import Path
 import sys
 import numpy as np
 import sounddevice as sd
+from concurrent.futures import ThreadPoolExecutor
 
 # Handle imports for both installed package and development mode
 try:
@@ -57,7 +59,7 @@ class StreamingASR:
                 print(f"Final: {result['text']}")
     """
     
-    def __init__(self, chunk_size_ms: int = 640, auto_finalize_after: float = 15.0, debug: bool = False):
+    def __init__(self, chunk_size_ms: int = 640, auto_finalize_after: float = 15.0, debug: bool = False, precision: str = 'fp32'):
         """
         Initialize StreamingASR.
         
@@ -65,10 +67,12 @@ class StreamingASR:
             chunk_size_ms: Chunk size in milliseconds (default: 640ms for optimal performance)
             auto_finalize_after: Maximum duration in seconds before auto-finalizing a segment (default: 15.0s)
             debug: Enable debug logging
+            precision: Inference precision, 'fp32' or 'fp16' (CUDA only, falls back to fp32)
         """
         self.chunk_size_ms = chunk_size_ms
         self.auto_finalize_after = auto_finalize_after
         self.debug = debug
+        self.precision = precision
         self.engine = None
         
         if self.debug:
@@ -83,13 +87,30 @@ class StreamingASR:
             self.engine = ASREngine(
                 chunk_size_ms=self.chunk_size_ms,
                 max_duration_before_forced_finalization=self.auto_finalize_after,
-                debug_mode=self.debug
+                debug_mode=self.debug,
+                precision=self.precision
             )
             self.engine.initialize_models()
             
             if self.debug:
                 print(f"{symbols['check']} [StreamingASR] ASR engine ready")
     
+    def warmup(self):
+        """
+        Load the models and run one silent chunk through the engine.
+        
+        Moves the model loading and first-inference cost out of the first
+        real chunk. The engine state is reset afterwards.
+        """
+        self._ensure_engine_initialized()
+        
+        chunk_size_samples = int(16000 * self.chunk_size_ms / 1000.0)
+        self.engine.process_audio(np.zeros(chunk_size_samples, dtype=np.float32), is_last=True)
+        self.engine.reset_state()
+        
+        if self.debug:
+            print(f"{symbols['check']} [StreamingASR] Warmup complete")
+    
     def stream_from_file(self, audio_file: str, chunk_size_ms: Optional[int] = None) -> Generator[Dict[str, Any], None, None]:
         """
         Stream ASR results from an audio file.
@@ -105,16 +126,21 @@ class StreamingASR:
                 - 'text': Transcription text
                 - 'chunk_info': Processing info (samples, duration, etc.)
         """
-        self._ensure_engine_initialized()
-        
         chunk_size = chunk_size_ms or self.chunk_size_ms
         
         if self.debug:
             print(f"{symbols['wave']} [StreamingASR] Starting file stream: {audio_file}")
             print(f"{symbols['ruler']} [StreamingASR] Chunk size: {chunk_size}ms")
         
-        # Load and prepare audio
-        audio_data = self._load_audio_file(audio_file)
+        # Load and prepare audio; on first use, do it in the background
+        # while the models load
+        if self.engine is None:
+            with ThreadPoolExecutor(max_workers=1) as loader:
+                audio_future = loader.submit(self._load_audio_file, audio_file)
+                self._ensure_engine_initialized()
+                audio_data = audio_future.result()
+        else:
+            audio_data = self._load_audio_file(audio_file)
         if audio_data is None:
             return
         
@@ -207,59 +233,65 @@ class StreamingASR:
                 f"{symbols['wave']} [StreamingASR] Starting microphone stream at {samplerate}Hz, chunk size: {chunk_size}ms ({chunk_size_samples} samples)")
         self.engine.reset_state()
         start_time = time.time()
-        buffer = np.zeros((0,), dtype=np.float32)
+        audio_queue = queue.Queue()
         chunk_id = 0
 
         def callback(indata, frames, time_info, status):
-            nonlocal buffer
             if status:
                 print(status, file=sys.stderr)
-            buffer = np.concatenate((buffer, indata[:, 0]))
+            audio_queue.put(indata[:, 0].copy())
 
         with sd.InputStream(samplerate=samplerate, channels=1, dtype='float32', callback=callback):
+            blocks = []
+            buffered = 0
             while True:
                 if duration_seconds is not None and (time.time() - start_time) > duration_seconds:
                     is_last = True
                 else:
                     is_last = False
-                if len(buffer) >= chunk_size_samples or is_last:
-                    chunk = buffer[:chunk_size_samples]
-                    buffer = buffer[chunk_size_samples:]
-                    if len(chunk) == 0:
-                        if is_last:
-                            break
-                        else:
-                            time.sleep(0.01)
-                            continue
-                    chunk_id += 1
-                    if self.debug:
-                        print(
-                            f"{symbols['tool']} [StreamingASR] Processing mic chunk {chunk_id} ({len(chunk)} samples)")
-                    result = self.engine.process_audio(chunk, is_last=is_last)
-                    chunk_info = {
-                        'chunk_id': chunk_id,
-                        'samples': len(chunk),
-                        'duration_ms': len(chunk) / samplerate * 1000,
-                        'is_last': is_last
+                # Collect captured blocks until a full chunk is available; once
+                # recording time is up, take whatever is already queued
+                try:
+                    while buffered < chunk_size_samples:
+                        block = audio_queue.get_nowait() if is_last else audio_queue.get(timeout=0.1)
+                        blocks.append(block)
+                        buffered += len(block)
+                except queue.Empty:
+                    if not is_last:
+                        continue
+                if buffered == 0:
+                    break
+                audio = np.concatenate(blocks)
+                chunk = audio[:chunk_size_samples]
+                blocks = [audio[chunk_size_samples:]]
+                buffered = len(blocks[0])
+                chunk_id += 1
+                if self.debug:
+                    print(
+                        f"{symbols['tool']} [StreamingASR] Processing mic chunk {chunk_id} ({len(chunk)} samples)")
+                result = self.engine.process_audio(chunk, is_last=is_last)
+                chunk_info = {
+                    'chunk_id': chunk_id,
+                    'samples': len(chunk),
+                    'duration_ms': len(chunk) / samplerate * 1000,
+                    'is_last': is_last
+                }
+                if result.get('current_transcription'):
+                    yield {
+                        'partial': True,
+                        'final': False,
+                        'text': result['current_transcription'],
+                        'chunk_info': chunk_info
                     }
-                    if result.get('current_transcription'):
-                        yield {
-                            'partial': True,
-                            'final': False,
-                            'text': result['current_transcription'],
-                            'chunk_info': chunk_info
-                        }
-                    if result.get('new_final_text'):
-                        yield {
-                            'partial': False,
-                            'final': True,
-                            'text': result['new_final_text'],
-                            'chunk_info': chunk_info
-                        }
-                    if is_last:
-                        break
-                else:
-                    time.sleep(0.01)
+                if result.get('new_final_text'):
+                    yield {
+                        'partial': False,
+                        'final': True,
+                        'text': result['new_final_text'],
+                        'chunk_info': chunk_info
+                    }
+                if is_last:
+                    break
         if self.debug:
             print(f"{symbols['check']} [StreamingASR] Microphone streaming complete.")
     
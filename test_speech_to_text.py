@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test script for the speech_to_text results file.
+Runs without the ASR models by feeding SpeechToText canned results.
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Fix encoding issues on Windows
+if sys.platform.startswith('win'):
+    import io
+    if hasattr(sys.stdout, 'reconfigure'):
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+        except:
+            pass
+    else:
+        # Fallback for older Python versions
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Define symbols that work across platforms
+symbols = {
+    'test': '🧪' if sys.stdout.encoding and 'utf' in sys.stdout.encoding.lower() else '[TEST]',
+    'check': '✅' if sys.stdout.encoding and 'utf' in sys.stdout.encoding.lower() else '[OK]',
+    'cross': '❌' if sys.stdout.encoding and 'utf' in sys.stdout.encoding.lower() else '[FAIL]',
+    'chart': '📊' if sys.stdout.encoding and 'utf' in sys.stdout.encoding.lower() else '[STATS]',
+    'party': '🎉' if sys.stdout.encoding and 'utf' in sys.stdout.encoding.lower() else '[SUCCESS]',
+}
+
+import speech_to_text
+from speech_to_text import SpeechToText, _ResultWriter
+
+SEGMENTS = ["xin chào các bạn", "hôm nay trời đẹp", "cảm ơn"]
+
+
+class FakeASR:
+    """Stands in for StreamingASR, yielding a fixed list of final segments."""
+
+    def __init__(self, segments, fail_after=None):
+        self.segments = segments
+        self.fail_after = fail_after
+
+    def stream_from_file(self, audio_file):
+        total = len(self.segments)
+        for i, text in enumerate(self.segments):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("simulated ASR failure")
+            chunk_info = {'chunk_id': i + 1, 'total_chunks': total}
+            yield {'partial': True, 'final': False, 'text': text, 'chunk_info': chunk_info}
+            yield {'partial': False, 'final': True, 'text': text, 'chunk_info': chunk_info}
+
+
+def _transcribe(tmp_dir, asr):
+    """Run transcribe_file on a dummy audio file with the given fake ASR."""
+    audio_file = os.path.join(tmp_dir, "audio.wav")
+    output_file = os.path.join(tmp_dir, "results.json")
+    with open(audio_file, 'wb') as f:
+        f.write(b"RIFF")
+
+    stt = SpeechToText(preload=False)
+    stt.asr = asr
+    results = stt.transcribe_file(audio_file, output_file)
+
+    with open(output_file, encoding='utf-8') as f:
+        raw = f.read()
+    return results, raw, json.loads(raw)
+
+
+def test_complete_file():
+    """The results file matches the returned results and keeps non-ASCII text as is."""
+    print(f"{symbols['test']} Complete results file")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results, raw, saved = _transcribe(tmp_dir, FakeASR(SEGMENTS))
+
+        assert results is not None
+        assert saved['segments'] == SEGMENTS == results['segments']
+        assert saved['transcription'] == " ".join(SEGMENTS) == results['transcription']
+        assert saved['metadata'] == results['metadata']
+        # Vietnamese text is stored as UTF-8, not as \u escapes
+        assert SEGMENTS[0] in raw
+
+        print(f"{symbols['check']} Complete results file test passed")
+        return True
+
+    except Exception as e:
+        print(f"{symbols['cross']} Complete results file test failed: {e!r}")
+        return False
+
+
+def test_interrupted_file():
+    """A transcription that fails midway still leaves valid JSON with the segments so far."""
+    print(f"{symbols['test']} Interrupted results file")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results, _, saved = _transcribe(tmp_dir, FakeASR(SEGMENTS, fail_after=2))
+
+        assert results is None
+        assert saved['segments'] == SEGMENTS[:2]
+        assert saved['transcription'] == " ".join(SEGMENTS[:2])
+
+        print(f"{symbols['check']} Interrupted results file test passed")
+        return True
+
+    except Exception as e:
+        print(f"{symbols['cross']} Interrupted results file test failed: {e!r}")
+        return False
+
+
+class FullDiskFile:
+    """File object whose writes fail as if the disk were full."""
+
+    def __init__(self):
+        self.closed = False
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def close(self):
+        self.closed = True
+
+
+class FullDiskWriter(_ResultWriter):
+    """Results writer backed by a FullDiskFile; keeps track of its instances."""
+
+    instances = []
+
+    def __init__(self, output_file, metadata):
+        self.file = FullDiskFile()
+        self.count = 0
+        FullDiskWriter.instances.append(self)
+
+
+def test_failing_writer():
+    """A results file that cannot be written is reported, closed and not raised."""
+    print(f"{symbols['test']} Failing results file")
+
+    original_writer = speech_to_text._ResultWriter
+    speech_to_text._ResultWriter = FullDiskWriter
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            audio_file = os.path.join(tmp_dir, "audio.wav")
+            with open(audio_file, 'wb') as f:
+                f.write(b"RIFF")
+
+            stt = SpeechToText(preload=False)
+            stt.asr = FakeASR(SEGMENTS)
+            results = stt.transcribe_file(audio_file, os.path.join(tmp_dir, "results.json"))
+
+        assert results is None
+        assert FullDiskWriter.instances and FullDiskWriter.instances[-1].file.closed
+
+        print(f"{symbols['check']} Failing results file test passed")
+        return True
+
+    except Exception as e:
+        print(f"{symbols['cross']} Failing results file test failed: {e!r}")
+        return False
+    finally:
+        speech_to_text._ResultWriter = original_writer
+
+
+def test_empty_file():
+    """A writer closed without segments produces an empty segments array."""
+    print(f"{symbols['test']} Empty results file")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "results.json")
+            writer = _ResultWriter(output_file, {'source': 'microphone'})
+            writer.close("")
+            with open(output_file, encoding='utf-8') as f:
+                saved = json.load(f)
+
+        assert saved == {'metadata': {'source': 'microphone'}, 'segments': [], 'transcription': ''}
+
+        print(f"{symbols['check']} Empty results file test passed")
+        return True
+
+    except Exception as e:
+        print(f"{symbols['cross']} Empty results file test failed: {e!r}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Starting speech_to_text tests...\n")
+
+    outcomes = {
+        "Complete results file": test_complete_file(),
+        "Interrupted results file": test_interrupted_file(),
+        "Empty results file": test_empty_file(),
+        "Failing results file": test_failing_writer(),
+    }
+
+    print("\n" + "=" * 60)
+    print(f"{symbols['chart']} OVERALL TEST RESULTS")
+    print("=" * 60)
+    for name, ok in outcomes.items():
+        print(f"{name}: {symbols['check'] + ' PASS' if ok else symbols['cross'] + ' FAIL'}")
+
+    if all(outcomes.values()):
+        print(f"\n{symbols['party']} All tests passed!")
+    else:
+        print(f"\n{symbols['cross']} Some tests failed. Please check the errors above.")
+        sys.exit(1)